@@ -1,99 +1,233 @@
 #!/usr/bin/env python3
 """
 Validate CCR package registry using BCR-style folder structure.
-Usage: python validate.py [package_name]
-       python validate.py --all
+Usage: python validate.py [--fast] [package_name]
+       python validate.py [--fast] --all
+
+--fast reports only the first error of each package.
 """
 
 import json
 import sys
 import os
+from functools import cache
+from hashlib import blake2b
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
-import re
+from typing import Optional, Union
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional: stdlib json accepts the same bytes input
+    json_loads = json.loads
 
 REGISTRY_DIR = Path(__file__).parent.parent / "registry" / "packages"
+# Plain-string form for the --all scan, which avoids building Path objects
+REGISTRY_DIR_STR = str(REGISTRY_DIR)
+
+# Results of earlier --all runs, keyed by a hash of each package's files
+CACHE_PATH = Path(__file__).parent.parent / ".validate_cache.json"
 
 # Required fields for metadata.json
 REQUIRED_METADATA_FIELDS = ["name", "description", "homepage", "license", "repository", "default_version", "targets", "maintainers"]
+REQUIRED_METADATA_FIELDS_SET = frozenset(REQUIRED_METADATA_FIELDS)
 
 # Required fields for source.json
 REQUIRED_SOURCE_FIELDS = ["git_tag", "tested"]
+REQUIRED_SOURCE_FIELDS_SET = frozenset(REQUIRED_SOURCE_FIELDS)
+
+# Errors reported per package before the rest are omitted
+MAX_ERRORS = 16
+
+# Below this many packages, process pool startup costs more than it saves
+PARALLEL_THRESHOLD = 32
 
-VALID_REPO_TYPES = ["github", "gitlab", "url"]
-NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+# Reads are I/O-bound, so use more threads than cores to keep the disk queue full
+IO_WORKERS = 64
+
+VALID_REPO_TYPES = frozenset({"github", "gitlab", "url"})
+# Only the schema validators need this as a regex, and they compile it themselves
+NAME_PATTERN = r"^[a-z][a-z0-9_]*$"
+# Byte-level equivalent of NAME_PATTERN for is_valid_name
+NAME_LEAD_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyz")
+NAME_BYTES = b"abcdefghijklmnopqrstuvwxyz0123456789_"
 
 # Common SPDX license identifiers
-VALID_LICENSES = {
+VALID_LICENSES = frozenset({
     "MIT", "Apache-2.0", "BSD-2-Clause", "BSD-3-Clause", "BSL-1.0",
     "MPL-2.0", "LGPL-2.1", "LGPL-3.0", "GPL-2.0", "GPL-3.0",
     "Unlicense", "ISC", "Zlib", "CC0-1.0"
+})
+
+# JSON Schemas mirroring the per-field checks in validate_metadata/validate_source.
+# Cross-file rules (directory name, default_version) are not expressible here.
+METADATA_SCHEMA = {
+    "type": "object",
+    "required": REQUIRED_METADATA_FIELDS,
+    "properties": {
+        "name": {"type": "string", "pattern": NAME_PATTERN},
+        "description": {"type": "string", "maxLength": 200},
+        "license": {"enum": sorted(VALID_LICENSES)},
+        "repository": {
+            "type": "object",
+            "required": ["type", "url"],
+            "properties": {"type": {"enum": sorted(VALID_REPO_TYPES)}},
+        },
+        "targets": {"type": "array", "minItems": 1},
+        "maintainers": {"type": "array", "minItems": 1},
+        "dependencies": {
+            "type": "array",
+            "items": {"type": "object", "required": ["name"]},
+        },
+    },
 }
 
+SOURCE_SCHEMA = {
+    "type": "object",
+    "required": REQUIRED_SOURCE_FIELDS,
+    "properties": {"cmake_options": {"type": "object"}},
+}
+
+
+def compile_schema(schema: dict):
+    """Compile a schema once into a predicate, or None if no validator is installed."""
+    try:
+        import fastjsonschema
+    except ImportError:  # Optional: try jsonschema, else the field-by-field checks below
+        try:
+            from jsonschema import Draft7Validator
+        except ImportError:
+            return None
+        # Build the validator once; jsonschema.validate() would redo this per call
+        Draft7Validator.check_schema(schema)
+        return Draft7Validator(schema).is_valid
+
+    validate = fastjsonschema.compile(schema)
+
+    def is_valid(data) -> bool:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return is_valid
+
+
+# Compiled on first use, so runs that validate nothing (cache hits) skip the
+# import and code generation
+@cache
+def metadata_validator():
+    """METADATA_SCHEMA as a compiled predicate, or None."""
+    return compile_schema(METADATA_SCHEMA)
+
+
+@cache
+def source_validator():
+    """SOURCE_SCHEMA as a compiled predicate, or None."""
+    return compile_schema(SOURCE_SCHEMA)
+
 
 class ValidationError(Exception):
     pass
 
 
-def validate_metadata(pkg_dir: Path, metadata: dict) -> list[str]:
+def is_valid_name(name: str) -> bool:
+    """Check a package name against NAME_PATTERN without the regex engine."""
+    # Non-ASCII can't match, and encoding a lone surrogate would raise
+    if not name.isascii():
+        return False
+    raw = name.encode()
+    # Deleting every allowed byte leaves nothing behind only for valid names
+    return bool(raw) and raw[0] in NAME_LEAD_BYTES and not raw.translate(None, NAME_BYTES)
+
+
+def validate_metadata(pkg_name: str, metadata: dict) -> list[str]:
     """Validate metadata.json content."""
+    # Fast path: the compiled schema accepts the document, so only the
+    # directory check remains. Failures fall through for detailed messages.
+    # The schema's "pattern" runs via re.search, where "$" also matches before
+    # a trailing newline, so the name is rechecked with is_valid_name.
+    metadata_is_valid = metadata_validator()
+    if metadata_is_valid is not None and metadata_is_valid(metadata) and is_valid_name(metadata["name"]):
+        name = metadata["name"]
+        if pkg_name != name:
+            return [f"Directory name '{pkg_name}' doesn't match package name '{name}'"]
+        return []
+
     errors = []
     
-    # Check required fields
-    for field in REQUIRED_METADATA_FIELDS:
-        if field not in metadata:
-            errors.append(f"metadata.json missing required field: {field}")
+    # Check required fields; iterate the list to keep declaration order
+    missing = REQUIRED_METADATA_FIELDS_SET.difference(metadata)
+    if missing:
+        # Can't continue without required fields
+        return [f"metadata.json missing required field: {field}" for field in REQUIRED_METADATA_FIELDS if field in missing]
     
-    if errors:
-        return errors  # Can't continue without required fields
+    # Look each field up once; everything below works on these locals
+    name = metadata["name"]
+    description = metadata["description"]
+    license_ = metadata["license"]
+    repo = metadata["repository"]
+    targets = metadata["targets"]
+    maintainers = metadata["maintainers"]
+    dependencies = metadata.get("dependencies", ())
     
     # Validate name matches directory
-    name = metadata["name"]
-    if not NAME_PATTERN.match(name):
+    if not is_valid_name(name):
         errors.append(f"Invalid name '{name}': must be lowercase alphanumeric + underscore, starting with letter")
     
-    if pkg_dir.name != name:
-        errors.append(f"Directory name '{pkg_dir.name}' doesn't match package name '{name}'")
+    if pkg_name != name:
+        errors.append(f"Directory name '{pkg_name}' doesn't match package name '{name}'")
     
     # Validate description
-    if len(metadata["description"]) > 200:
+    if len(description) > 200:
         errors.append("Description exceeds 200 characters")
     
     # Validate license
-    if metadata["license"] not in VALID_LICENSES:
-        errors.append(f"Unknown license '{metadata['license']}'. Use SPDX identifier.")
+    # Non-strings are unhashable or can't be SPDX ids; reject before the set lookup
+    if not isinstance(license_, str) or license_ not in VALID_LICENSES:
+        errors.append(f"Unknown license '{license_}'. Use SPDX identifier.")
     
     # Validate repository
-    repo = metadata["repository"]
     if "type" not in repo or "url" not in repo:
         errors.append("Repository must have 'type' and 'url' fields")
-    elif repo["type"] not in VALID_REPO_TYPES:
-        errors.append(f"Invalid repository type: {repo['type']}")
+    else:
+        repo_type = repo["type"]
+        if not isinstance(repo_type, str) or repo_type not in VALID_REPO_TYPES:
+            errors.append(f"Invalid repository type: {repo_type}")
     
     # Validate targets
-    if not metadata["targets"]:
+    if not targets:
         errors.append("At least one target must be specified")
     
     # Validate maintainers
-    if not metadata["maintainers"]:
+    if not maintainers:
         errors.append("At least one maintainer is required")
     
     # Validate dependencies if present
-    if "dependencies" in metadata:
-        for dep in metadata["dependencies"]:
-            if "name" not in dep:
-                errors.append("Dependency missing 'name' field")
+    for dep in dependencies:
+        if "name" not in dep:
+            errors.append("Dependency missing 'name' field")
     
     return errors
 
 
 def validate_source(version: str, source: dict) -> list[str]:
     """Validate source.json content."""
+    source_is_valid = source_validator()
+    if source_is_valid is not None and source_is_valid(source):
+        return []
+
     errors = []
     
-    for field in REQUIRED_SOURCE_FIELDS:
-        if field not in source:
-            errors.append(f"Version {version}: source.json missing required field: {field}")
+    # One set difference instead of a membership test per field; iterate the
+    # list to keep messages in declaration order
+    missing = REQUIRED_SOURCE_FIELDS_SET.difference(source)
+    if missing:
+        errors.extend(
+            f"Version {version}: source.json missing required field: {field}"
+            for field in REQUIRED_SOURCE_FIELDS if field in missing
+        )
     
     if "cmake_options" in source:
         if not isinstance(source["cmake_options"], dict):
@@ -102,63 +236,180 @@ def validate_source(version: str, source: dict) -> list[str]:
     return errors
 
 
-def get_version_dirs(pkg_dir: Path) -> list[Path]:
+def get_version_dirs(pkg_dir: Union[str, Path]) -> list[os.DirEntry]:
     """Get all version directories in a package directory."""
-    return [d for d in pkg_dir.iterdir() if d.is_dir()]
+    # DirEntry.is_dir() reuses the file type from readdir, saving a stat per entry
+    return [e for e in os.scandir(pkg_dir) if e.is_dir()]
 
 
-def validate_package(pkg_dir: Path) -> list[str]:
-    """Validate a single package directory. Returns list of errors."""
+def read_file(path: str) -> Optional[bytes]:
+    """Read a file's bytes, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    # NotADirectoryError: a parent path component is a plain file
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def read_package(pkg_dir: str) -> tuple[Optional[bytes], dict[str, Optional[bytes]]]:
+    """Read metadata.json and each version's source.json. Missing files are None."""
+    metadata_raw = read_file(os.path.join(pkg_dir, "metadata.json"))
+    if metadata_raw is None:
+        return None, {}
+    
+    sources = {}
+    for ver_dir in get_version_dirs(pkg_dir):
+        sources[ver_dir.name] = read_file(os.path.join(ver_dir.path, "source.json"))
+    
+    return metadata_raw, sources
+
+
+def read_packages_parallel(pkg_dirs: list[str]) -> list[tuple[Optional[bytes], dict[str, Optional[bytes]]]]:
+    """read_package for many packages, with every file as its own thread-pool task."""
+    # Imported here: concurrent.futures loads logging, which small runs never need
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Per-file tasks keep one package with many versions from serializing
+    # behind a single thread
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        versions_list = list(executor.map(
+            lambda path: [e.name for e in get_version_dirs(path)], pkg_dirs))
+        file_paths = []
+        for pkg_dir, versions in zip(pkg_dirs, versions_list):
+            file_paths.append(os.path.join(pkg_dir, "metadata.json"))
+            file_paths.extend(os.path.join(pkg_dir, v, "source.json") for v in versions)
+        raws = executor.map(read_file, file_paths)
+        
+        contents = []
+        for versions in versions_list:
+            metadata_raw = next(raws)
+            sources = {v: next(raws) for v in versions}
+            # Match read_package, so cache keys don't depend on the read path
+            contents.append((metadata_raw, sources) if metadata_raw is not None else (None, {}))
+    
+    return contents
+
+
+def truncate_errors(errors: list[str], max_errors: int) -> list[str]:
+    """Cap an error list at max_errors, noting that more were found."""
+    if len(errors) <= max_errors:
+        return errors
+    return errors[:max_errors] + ["... (more errors omitted)"]
+
+
+def check_package(pkg_name: str, metadata_raw: Optional[bytes], sources: dict[str, Optional[bytes]], max_errors: int = MAX_ERRORS) -> list[str]:
+    """Validate a package from the file contents returned by read_package. Returns list of errors."""
     errors = []
     
-    # Check metadata.json exists
-    metadata_path = pkg_dir / "metadata.json"
-    if not metadata_path.exists():
-        return [f"Missing metadata.json in {pkg_dir.name}"]
+    if metadata_raw is None:
+        return [f"Missing metadata.json in {pkg_name}"]
     
     try:
-        with open(metadata_path) as f:
-            metadata = json.load(f)
+        metadata = json_loads(metadata_raw)
     except json.JSONDecodeError as e:
         return [f"Invalid JSON in metadata.json: {e}"]
     
     # Validate metadata
-    errors.extend(validate_metadata(pkg_dir, metadata))
+    errors.extend(validate_metadata(pkg_name, metadata))
     
-    # Get version directories
-    version_dirs = get_version_dirs(pkg_dir)
-    if not version_dirs:
+    if not sources:
         errors.append("At least one version directory is required")
-        return errors
+        return truncate_errors(errors, max_errors)
+    
+    # Bind per-iteration lookups once outside the loop
+    append = errors.append
+    extend = errors.extend
+    loads = json_loads
+    decode_error = json.JSONDecodeError
     
-    versions_found = []
-    for ver_dir in version_dirs:
-        version = ver_dir.name
-        versions_found.append(version)
+    for version, source_raw in sources.items():
+        # The package already fails; skip checking the remaining versions
+        if len(errors) > max_errors:
+            break
         
-        source_path = ver_dir / "source.json"
-        if not source_path.exists():
-            errors.append(f"Version {version}: missing source.json")
+        if source_raw is None:
+            append(f"Version {version}: missing source.json")
             continue
         
         try:
-            with open(source_path) as f:
-                source = json.load(f)
-        except json.JSONDecodeError as e:
-            errors.append(f"Version {version}: invalid JSON in source.json: {e}")
+            source = loads(source_raw)
+        except decode_error as e:
+            append(f"Version {version}: invalid JSON in source.json: {e}")
             continue
         
-        errors.extend(validate_source(version, source))
+        extend(validate_source(version, source))
     
     # Validate default_version exists
     if "default_version" in metadata:
-        if metadata["default_version"] not in versions_found:
-            errors.append(f"default_version '{metadata['default_version']}' not found in version directories")
+        default_version = metadata["default_version"]
+        # sources is a dict, so guard against unhashable values before the lookup
+        if not isinstance(default_version, str) or default_version not in sources:
+            errors.append(f"default_version '{default_version}' not found in version directories")
     
-    return errors
+    return truncate_errors(errors, max_errors)
+
+
+def validate_package(pkg_dir: Path, max_errors: int = MAX_ERRORS) -> list[str]:
+    """Validate a single package directory. Returns list of errors."""
+    return check_package(pkg_dir.name, *read_package(str(pkg_dir)), max_errors)
+
+
+def schema_backend() -> str:
+    """Name the library compile_schema picks, or "none", without importing it."""
+    from importlib.util import find_spec
+    
+    for name in ("fastjsonschema", "jsonschema"):
+        if find_spec(name) is not None:
+            return name
+    return "none"
+
+
+def rules_digest(max_errors: int) -> bytes:
+    """Fingerprint the validation rules so that editing them invalidates the cache."""
+    h = blake2b(Path(__file__).read_bytes(), digest_size=16)
+    # "Invalid JSON" messages depend on which parser is installed, and the
+    # schema validator decides which documents skip the detailed checks
+    h.update(json_loads.__module__.encode())
+    h.update(schema_backend().encode())
+    h.update(b"%d" % max_errors)
+    return h.digest()
 
 
-def validate_all() -> dict[str, list[str]]:
+def cache_key(rules: bytes, pkg_name: str, metadata_raw: Optional[bytes], sources: dict[str, Optional[bytes]]) -> str:
+    """Hash everything check_package's result depends on."""
+    h = blake2b(rules, digest_size=16)
+    parts = [pkg_name.encode(), metadata_raw]
+    for version in sorted(sources):
+        parts += [version.encode(), sources[version]]
+    for part in parts:
+        # Length-prefix each part so that adjacent files can't alias
+        if part is None:
+            h.update(b"-")
+        else:
+            h.update(b"%d:" % len(part))
+            h.update(part)
+    return h.hexdigest()
+
+
+def load_cache() -> dict[str, list[str]]:
+    """Load cached results, treating an unreadable cache as empty."""
+    try:
+        cache = json_loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache: dict[str, list[str]]):
+    """Persist cached results. Failing to write only costs speed next run."""
+    try:
+        CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
+def validate_all(max_errors: int = MAX_ERRORS) -> dict[str, list[str]]:
     """Validate all packages. Returns dict of package name -> errors."""
     results = {}
     
@@ -166,46 +417,90 @@ def validate_all() -> dict[str, list[str]]:
         print(f"❌ Registry directory not found: {REGISTRY_DIR}")
         sys.exit(1)
     
-    for pkg_dir in REGISTRY_DIR.iterdir():
-        if pkg_dir.is_dir():
-            errors = validate_package(pkg_dir)
-            if errors:
-                results[pkg_dir.name] = errors
+    # Plain strings rather than DirEntry objects: names get pickled to pool workers
+    pkg_paths = []
+    pkg_names = []
+    for entry in os.scandir(REGISTRY_DIR_STR):
+        if entry.is_dir():
+            pkg_paths.append(entry.path)
+            pkg_names.append(entry.name)
+    
+    # Read everything up front so the validation pass never waits on disk.
+    # Small registries read faster serially than through a thread pool.
+    if len(pkg_paths) > PARALLEL_THRESHOLD:
+        contents = read_packages_parallel(pkg_paths)
+    else:
+        contents = [read_package(path) for path in pkg_paths]
+    
+    # Only packages whose files changed since the last run need validating
+    cache = load_cache()
+    rules = rules_digest(max_errors)
+    keys = [cache_key(rules, name, m, s) for name, (m, s) in zip(pkg_names, contents)]
+    pending = [i for i, key in enumerate(keys) if key not in cache]
+    pending_names = [pkg_names[i] for i in pending]
+    metadata_raws = [contents[i][0] for i in pending]
+    sources_list = [contents[i][1] for i in pending]
+    
+    if len(pending) > PARALLEL_THRESHOLD:
+        # Imported here: it pulls in multiprocessing, which small runs never need
+        from concurrent.futures import ProcessPoolExecutor
+        
+        chunksize = max(1, len(pending) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            all_errors = list(executor.map(check_package, pending_names, metadata_raws, sources_list, repeat(max_errors), chunksize=chunksize))
+    else:
+        all_errors = list(map(check_package, pending_names, metadata_raws, sources_list, repeat(max_errors)))
+    
+    for i, errors in zip(pending, all_errors):
+        cache[keys[i]] = errors
+    # Drop entries for packages that no longer exist in this form
+    save_cache({key: cache[key] for key in keys})
+    
+    for pkg_name, key in zip(pkg_names, keys):
+        if cache[key]:
+            results[pkg_name] = cache[key]
     
     return results
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate.py [package_name | --all]")
+    args = sys.argv[1:]
+    fast = "--fast" in args
+    if fast:
+        args.remove("--fast")
+    max_errors = 1 if fast else MAX_ERRORS
+    
+    if not args:
+        print("Usage: python validate.py [--fast] [package_name | --all]")
         sys.exit(1)
     
-    if sys.argv[1] == "--all":
-        results = validate_all()
+    if args[0] == "--all":
+        results = validate_all(max_errors)
         
         # Count packages
-        pkg_count = sum(1 for p in REGISTRY_DIR.iterdir() if p.is_dir())
+        pkg_count = sum(1 for e in os.scandir(REGISTRY_DIR_STR) if e.is_dir())
         
         if results:
-            print("❌ Validation errors found:\n")
+            # Build the report in memory and write it once, not a write per line
+            buf = ["❌ Validation errors found:\n\n"]
             for pkg, errors in sorted(results.items()):
-                print(f"  {pkg}:")
-                for error in errors:
-                    print(f"    - {error}")
-            print(f"\n{pkg_count - len(results)}/{pkg_count} packages valid")
+                buf.append(f"  {pkg}:\n")
+                buf.extend(f"    - {error}\n" for error in errors)
+            buf.append(f"\n{pkg_count - len(results)}/{pkg_count} packages valid\n")
+            sys.stdout.write("".join(buf))
             sys.exit(1)
         else:
             print(f"✅ All {pkg_count} packages valid!")
             sys.exit(0)
     else:
-        pkg_name = sys.argv[1]
+        pkg_name = args[0]
         pkg_dir = REGISTRY_DIR / pkg_name
         
         if not pkg_dir.exists():
             print(f"❌ Package '{pkg_name}' not found")
             sys.exit(1)
         
-        errors = validate_package(pkg_dir)
+        errors = validate_package(pkg_dir, max_errors)
         if errors:
             print(f"❌ Validation errors for {pkg_name}:")
             for error in errors: